@@ -1,7 +1,10 @@
 import string
 import unicodedata
 from collections import Counter
+from functools import lru_cache, partial
 from utils_cipher import UtilsCipher  
+from evaluador_candidatos import EvaluadorCandidatos
+from array import array
 
 class CifradoAfin:
     @staticmethod
@@ -111,6 +114,81 @@ class CifradoAfin:
         # Dividir en bloques de 10 letras
         return ' '.join([texto_descifrado[i:i+10] for i in range(0, len(texto_descifrado), 10)])
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def inverso(a, N):
+        """
+        Inverso multiplicativo de 'a' mod N, calculado una sola vez por valor de 'a'.
+        Las búsquedas descifran muchos fragmentos con la misma clave.
+        
+        :param a: El valor de a en la fórmula afín.
+        :param N: El tamaño del alfabeto.
+        :return: El inverso de 'a' mod N, o None si no existe.
+        """
+        return UtilsCipher.mod_inverse(a, N)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def coprimos(N):
+        """
+        Valores de 'a' coprimos con N, en orden creciente.
+        
+        :param N: El tamaño del alfabeto.
+        :return: Tupla de valores válidos de 'a'.
+        """
+        return tuple(a for a in range(1, N) if UtilsCipher.gcd(a, N) == 1)
+
+    @staticmethod
+    def descifrar_numeros(clave, numeros, desplazamiento, N):
+        """
+        Descifra una secuencia de posiciones en el alfabeto con la clave (a, b).
+        El desplazamiento no afecta al cifrado afín, pero se recibe para cumplir con
+        la interfaz de `EvaluadorCandidatos`.
+        
+        :param clave: Tupla (a, b) del cifrado afín.
+        :param numeros: Secuencia de posiciones del texto cifrado.
+        :param desplazamiento: Posición del fragmento dentro del texto completo.
+        :param N: El tamaño del alfabeto.
+        :return: Lista de posiciones descifradas.
+        """
+        a, b = clave
+        a_inv = CifradoAfin.inverso(a, N)
+        return [a_inv * (x - b) % N for x in numeros]
+
+    @staticmethod
+    def claves_posibles(N):
+        """
+        Genera todas las claves (a, b) válidas para un alfabeto de tamaño N.
+        
+        :param N: El tamaño del alfabeto.
+        :return: Generador de tuplas (a, b) con 'a' coprimo con N.
+        """
+        for a in CifradoAfin.coprimos(N):  # Solo probar valores de 'a' coprimos con N
+            for b in range(N):
+                yield (a, b)
+
+    @staticmethod
+    def clave_por_indice(indice, N):
+        """
+        Obtiene la clave (a, b) que ocupa la posición `indice` en el orden de `claves_posibles`.
+        Permite repartir el espacio de claves por rangos de índices.
+        
+        :param indice: Posición de la clave, entre 0 y total_claves(N) - 1.
+        :param N: El tamaño del alfabeto.
+        :return: Tupla (a, b).
+        """
+        return (CifradoAfin.coprimos(N)[indice // N], indice % N)
+
+    @staticmethod
+    def total_claves(N):
+        """
+        Cuenta las claves (a, b) válidas para un alfabeto de tamaño N.
+        
+        :param N: El tamaño del alfabeto.
+        :return: Número de claves.
+        """
+        return len(CifradoAfin.coprimos(N)) * N
+
     @staticmethod
     def fuerza_bruta(texto_cifrado, bandera):
         """
@@ -124,20 +202,111 @@ class CifradoAfin:
         alfabeto = CifradoAfin.obtener_alfabeto(bandera)
         N = len(alfabeto)
 
+        # Preprocesar una sola vez y descifrar solo las letras que se muestran:
+        # 100 caracteres en bloques de 10 corresponden a 91 letras
+        texto_cifrado = CifradoAfin.preprocesar_texto(texto_cifrado, bandera)
+        try:
+            numeros = UtilsCipher.texto_a_numeros(texto_cifrado, alfabeto)[:91]
+        except ValueError:
+            # Ninguna clave descifra un texto con letras fuera del alfabeto
+            return ''
+
         resultados = []  # Lista para almacenar los resultados
 
         # Probar todas las combinaciones posibles de 'a' y 'b'
-        for a in range(1, N):
-            if UtilsCipher.gcd(a, N) == 1:  # Solo probar valores de 'a' coprimos con N
-                for b in range(N):
-                    try:
-                        texto_descifrado = CifradoAfin.descifrar(texto_cifrado, a, b, bandera)
-                        # Tomar solo los primeros 100 caracteres del texto descifrado
-                        texto_descifrado_truncado = texto_descifrado[:100]
-                        # Formatear la salida y agregarla a la lista de resultados
-                        resultados.append(f"a = {a}, b = {b}\n{texto_descifrado_truncado}\n")
-                    except ValueError:
-                        continue
+        for a, b in CifradoAfin.claves_posibles(N):
+            texto_descifrado = UtilsCipher.numeros_a_texto(
+                CifradoAfin.descifrar_numeros((a, b), numeros, 0, N), alfabeto)
+            # Tomar solo los primeros 100 caracteres del texto descifrado
+            texto_descifrado_truncado = ' '.join([texto_descifrado[i:i+10] for i in range(0, len(texto_descifrado), 10)])[:100]
+            # Formatear la salida y agregarla a la lista de resultados
+            resultados.append(f"a = {a}, b = {b}\n{texto_descifrado_truncado}\n")
 
         # Devolver todos los resultados como un solo string
         return ''.join(resultados)
+
+    @staticmethod
+    def fuerza_bruta_ranking(texto_cifrado, bandera, k=5, procesos=None, ruta_punto_control=None,
+                             inicio=0, fin=None):
+        """
+        Rompe el cifrado afín puntuando cada clave sobre una muestra del texto cifrado
+        y descifrando completo solo los k candidatos más parecidos al idioma.
+        
+        :param texto_cifrado: El texto cifrado que se va a romper.
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        :param k: Número de candidatos a devolver.
+        :param procesos: Si se indica, reparte las claves entre ese número de procesos que
+                         comparten el texto y la tabla de frecuencias en memoria compartida.
+        :param ruta_punto_control: Si se indica, guarda el avance en ese archivo y, si ya existe,
+                                   reanuda la búsqueda desde él.
+        :param inicio: Primer índice de clave a probar; requiere `ruta_punto_control` si no es 0.
+        :param fin: Índice final (exclusivo) de las claves a probar; por defecto todas. Cada
+                    máquina puede recorrer un rango y luego se combinan con `fusionar_rangos`.
+        :return: Lista de tuplas (puntaje, (a, b), texto_descifrado) de mayor a menor puntaje.
+        """
+        alfabeto = CifradoAfin.obtener_alfabeto(bandera)
+        N = len(alfabeto)
+        total_claves = CifradoAfin.total_claves(N)
+
+        texto_cifrado = CifradoAfin.preprocesar_texto(texto_cifrado, bandera)
+        numeros = UtilsCipher.texto_a_numeros(texto_cifrado, alfabeto)
+
+        evaluador = EvaluadorCandidatos(alfabeto, bandera, k=k, por_letra=True)
+        descifrar = partial(CifradoAfin.descifrar_numeros, N=N)
+
+        if procesos is not None and ruta_punto_control is not None:
+            raise ValueError("La búsqueda paralela no admite puntos de control; reparta el rango de claves.")
+        if (inicio, fin) not in ((0, None), (0, total_claves)) and ruta_punto_control is None:
+            raise ValueError("Un rango parcial de claves requiere un punto de control para fusionarlo después.")
+
+        if ruta_punto_control is not None:
+            from busqueda_reanudable import BusquedaReanudable
+            busqueda = BusquedaReanudable(ruta_punto_control, numeros, total_claves,
+                                          partial(CifradoAfin.clave_por_indice, N=N), descifrar, evaluador,
+                                          inicio=inicio, fin=fin)
+            resultados = evaluador.confirmar(numeros, busqueda.ejecutar(), descifrar)
+        elif procesos is None:
+            resultados = evaluador.evaluar(numeros, CifradoAfin.claves_posibles(N), descifrar)
+        else:
+            # Importación diferida: multiprocessing solo se carga en la búsqueda paralela
+            from pool_memoria_compartida import PoolMemoriaCompartida
+            buffers = {'texto': bytes(numeros), 'tabla': array('d', evaluador.tabla)}
+            with PoolMemoriaCompartida(buffers, procesos) as pool:
+                mejores = pool.buscar_claves(total_claves,
+                                             partial(CifradoAfin.clave_por_indice, N=N),
+                                             descifrar, k=k, por_letra=True)
+            resultados = evaluador.confirmar(numeros, mejores, descifrar)
+
+        # Dividir en bloques de 10 letras
+        return [(puntaje, clave, ' '.join([texto[i:i+10] for i in range(0, len(texto), 10)]))
+                for puntaje, clave, texto in resultados]
+
+    @staticmethod
+    def fusionar_rangos(rutas, texto_cifrado, bandera, k=5):
+        """
+        Combina los puntos de control de búsquedas parciales hechas con
+        `fuerza_bruta_ranking(..., ruta_punto_control=..., inicio=..., fin=...)` y descifra
+        completo solo los k mejores candidatos globales. Los rangos deben cubrir juntos
+        todas las claves, sin traslaparse.
+        
+        :param rutas: Rutas de los puntos de control de cada rango.
+        :param texto_cifrado: El mismo texto cifrado usado en cada rango.
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        :param k: Número de candidatos a devolver; el mismo usado en cada rango.
+        :return: Lista de tuplas (puntaje, (a, b), texto_descifrado) de mayor a menor puntaje.
+        """
+        from busqueda_reanudable import BusquedaReanudable
+        alfabeto = CifradoAfin.obtener_alfabeto(bandera)
+        N = len(alfabeto)
+
+        texto_cifrado = CifradoAfin.preprocesar_texto(texto_cifrado, bandera)
+        numeros = UtilsCipher.texto_a_numeros(texto_cifrado, alfabeto)
+
+        evaluador = EvaluadorCandidatos(alfabeto, bandera, k=k, por_letra=True)
+        huella = BusquedaReanudable.calcular_huella(numeros, CifradoAfin.total_claves(N), evaluador)
+        mejores = BusquedaReanudable.fusionar(rutas, k, partial(CifradoAfin.clave_por_indice, N=N), huella)
+        resultados = evaluador.confirmar(numeros, mejores, partial(CifradoAfin.descifrar_numeros, N=N))
+
+        # Dividir en bloques de 10 letras
+        return [(puntaje, clave, ' '.join([texto[i:i+10] for i in range(0, len(texto), 10)]))
+                for puntaje, clave, texto in resultados]
@@ -0,0 +1,153 @@
+import heapq
+import numpy as np
+from utils_cipher import UtilsCipher
+from utils_vectorizado import UtilsVectorizado
+from vigenere_cipher import CifradoVigenere
+
+
+def tabla_desplazamientos(numeros, longitud, tabla, N):
+    """
+    Precalcula S[j][s]: puntaje de las letras en posiciones j (mod longitud) descifradas
+    con el desplazamiento s. El puntaje de una clave k es entonces sum_j S[j][k_j], así
+    que cada clave cuesta `longitud` consultas sin importar el tamaño del texto.
+
+    :param numeros: El texto cifrado como arreglo de posiciones en el alfabeto.
+    :param longitud: Longitud de las claves.
+    :param tabla: Arreglo de log-probabilidades por letra.
+    :param N: El tamaño del alfabeto.
+    :return: Arreglo float64 de forma (longitud, N).
+    """
+    # conteos[j][c]: veces que aparece la letra cifrada c en posiciones j (mod longitud)
+    conteos = np.zeros((longitud, N), dtype=np.float64)
+    np.add.at(conteos, (np.arange(len(numeros)) % longitud, numeros), 1)
+
+    # Descifrar c con s da (c - s) mod N, así que S[j][s] = sum_c conteos[j][c] * tabla[(c - s) mod N]
+    c = np.arange(N)
+    s = np.arange(N)
+    puntaje_letra = tabla[(c[:, None] - s[None, :]) % N]  # (c, s)
+    return conteos @ puntaje_letra
+
+
+def puntuar_claves(vistas, descriptor):
+    """
+    Tarea para `PoolMemoriaCompartida`: puntúa un rango de claves de una misma longitud
+    leyendo el prefijo, la tabla y la lista de claves directamente de memoria compartida.
+
+    :param vistas: Vistas compartidas 'prefijo', 'tabla' y 'claves_<longitud>'.
+    :param descriptor: Tupla (longitud, inicio, fin, k).
+    :return: Lista de tuplas (puntaje, longitud, fila) con a lo más k elementos.
+    """
+    longitud, inicio, fin, k = descriptor
+    prefijo = np.frombuffer(vistas['prefijo'], dtype=np.uint8)
+    tabla = np.frombuffer(vistas['tabla'], dtype=np.float64)
+    claves = np.frombuffer(vistas[f'claves_{longitud}'], dtype=np.uint8).reshape(-1, longitud)
+    S = tabla_desplazamientos(prefijo, longitud, tabla, len(tabla))
+    return AtaqueDiccionarioVigenere.mejores_del_grupo(S, claves[inicio:fin], k, inicio)
+
+
+class AtaqueDiccionarioVigenere:
+    @staticmethod
+    def agrupar_palabras(palabras, bandera):
+        """
+        Preprocesa las palabras candidatas y las agrupa por longitud como matrices de posiciones.
+        Se descartan las palabras repetidas y las que tienen letras fuera del alfabeto.
+
+        :param palabras: Iterable de palabras.
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        :return: Diccionario longitud -> arreglo uint8 de forma (número de palabras, longitud).
+        """
+        alfabeto = CifradoVigenere.obtener_alfabeto(bandera)
+        letras = set(alfabeto)
+        grupos = {}
+        for palabra in palabras:
+            palabra = CifradoVigenere.preprocesar_texto(palabra, bandera)
+            if palabra and set(palabra) <= letras:
+                grupos.setdefault(len(palabra), set()).add(palabra)
+
+        return {longitud: UtilsVectorizado.codificar(''.join(sorted(grupo)), alfabeto).reshape(-1, longitud)
+                for longitud, grupo in sorted(grupos.items())}
+
+    @staticmethod
+    def cargar_diccionario(ruta_archivo, bandera):
+        """
+        Carga una lista de palabras (una por línea) y la agrupa por longitud.
+
+        :param ruta_archivo: Ruta del archivo de palabras.
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        :return: Diccionario longitud -> arreglo uint8 de forma (número de palabras, longitud).
+        """
+        with open(ruta_archivo, 'r', encoding='utf-8') as archivo:
+            return AtaqueDiccionarioVigenere.agrupar_palabras(archivo.read().split(), bandera)
+
+    @staticmethod
+    def mejores_del_grupo(S, claves, k, desplazamiento=0):
+        """
+        Puntúa todas las claves de un grupo a la vez y devuelve las k mejores.
+
+        :param S: Tabla de puntajes por posición y desplazamiento (ver `tabla_desplazamientos`).
+        :param claves: Arreglo (número de claves, longitud) de posiciones en el alfabeto.
+        :param k: Número de claves a conservar.
+        :param desplazamiento: Se suma al número de fila devuelto.
+        :return: Lista de tuplas (puntaje, longitud, fila).
+        """
+        if len(claves) == 0:
+            return []
+        longitud = claves.shape[1]
+        puntajes = S[np.arange(longitud), claves].sum(axis=1)
+        k = min(k, len(puntajes))
+        mejores = np.argpartition(puntajes, len(puntajes) - k)[-k:]
+        return [(float(puntajes[fila]), longitud, int(fila) + desplazamiento) for fila in mejores]
+
+    @staticmethod
+    def atacar(texto_cifrado, diccionario, bandera, k=10, tam_prefijo=500, procesos=None):
+        """
+        Ataque de diccionario al cifrado Vigenère: puntúa todas las palabras como clave
+        sobre un prefijo del texto cifrado y confirma las k mejores sobre el texto completo.
+
+        :param texto_cifrado: El texto cifrado.
+        :param diccionario: Palabras agrupadas por longitud (ver `cargar_diccionario`).
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        :param k: Número de candidatos a devolver.
+        :param tam_prefijo: Número de letras del texto cifrado usadas para la puntuación.
+        :param procesos: Si se indica, reparte los grupos de palabras entre ese número de
+                         procesos que comparten el prefijo y el diccionario en memoria compartida.
+        :return: Lista de tuplas (puntaje, clave, texto_descifrado) de mayor a menor puntaje.
+        """
+        alfabeto = CifradoVigenere.obtener_alfabeto(bandera)
+        N = len(alfabeto)
+        texto_cifrado = CifradoVigenere.preprocesar_texto(texto_cifrado, bandera)
+        numeros = UtilsVectorizado.codificar(texto_cifrado, alfabeto)
+        prefijo = numeros[:tam_prefijo]
+        tabla = np.array(UtilsCipher.log_frecuencias(alfabeto, bandera))
+
+        if procesos is None:
+            candidatos = []
+            for longitud, claves in diccionario.items():
+                S = tabla_desplazamientos(prefijo, longitud, tabla, N)
+                candidatos.extend(AtaqueDiccionarioVigenere.mejores_del_grupo(S, claves, k))
+        else:
+            # Importación diferida: multiprocessing solo se carga en el ataque paralelo
+            from pool_memoria_compartida import PoolMemoriaCompartida
+            buffers = {'prefijo': np.ascontiguousarray(prefijo), 'tabla': tabla}
+            buffers.update({f'claves_{longitud}': claves.ravel() for longitud, claves in diccionario.items()})
+            tam_tarea = max(1, -(-sum(len(claves) for claves in diccionario.values()) // (4 * procesos)))
+            descriptores = [(longitud, inicio, min(inicio + tam_tarea, len(claves)), k)
+                            for longitud, claves in diccionario.items()
+                            for inicio in range(0, len(claves), tam_tarea)]
+            with PoolMemoriaCompartida(buffers, procesos) as pool:
+                candidatos = [candidato for parcial in pool.mapear(puntuar_claves, descriptores)
+                              for candidato in parcial]
+
+        # Confirmar los mejores descifrando el texto completo
+        resultados = []
+        posiciones = np.arange(len(numeros))
+        for _, longitud, fila in heapq.nlargest(k, candidatos):
+            clave = diccionario[longitud][fila]
+            descifrado = (numeros.astype(np.int64) - clave[posiciones % longitud]) % N
+            puntaje = float(tabla[descifrado].mean()) if len(descifrado) else 0.0
+            texto = UtilsVectorizado.decodificar(descifrado, alfabeto)
+            resultados.append((puntaje, UtilsVectorizado.decodificar(clave, alfabeto),
+                               UtilsVectorizado.dividir_en_bloques(texto)))
+
+        resultados.sort(key=lambda resultado: resultado[0], reverse=True)
+        return resultados
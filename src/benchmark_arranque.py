@@ -0,0 +1,55 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Importaciones que hacía main.py antes del registro: todos los cifrados, incluido Hill (numpy)
+IMPORTACION_ANTICIPADA = (
+    "from utils_cipher import UtilsCipher\n"
+    "from mono_alf_cipher import CifradoMonoalfabeticoAleatorio\n"
+    "from vigenere_cipher import CifradoVigenere\n"
+    "from affine_cipher import CifradoAfin\n"
+    "from hill_cipher import HillCipher\n"
+    "from playfair_cipher import PlayfairCipher\n"
+)
+
+# Importación con el registro: solo se carga el cifrado que se usa
+IMPORTACION_DIFERIDA = (
+    "from registro_cifrados import RegistroCifrados\n"
+    "RegistroCifrados.obtener('afin')\n"
+)
+
+
+def medir_arranque(codigo, repeticiones):
+    """
+    Mide el tiempo de arranque de un intérprete nuevo que ejecuta `codigo`.
+    
+    :param codigo: Código a ejecutar en cada intérprete.
+    :param repeticiones: Número de ejecuciones.
+    :return: Lista de tiempos en segundos.
+    """
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, '-c', codigo], cwd=directorio, check=True)
+        tiempos.append(time.perf_counter() - inicio)
+    return tiempos
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    base = statistics.median(medir_arranque('pass', repeticiones))
+    anticipada = statistics.median(medir_arranque(IMPORTACION_ANTICIPADA, repeticiones))
+    diferida = statistics.median(medir_arranque(IMPORTACION_DIFERIDA, repeticiones))
+
+    print(f"Intérprete vacío:         {base * 1000:8.2f} ms")
+    print(f"Importación anticipada:   {anticipada * 1000:8.2f} ms")
+    print(f"Registro (solo afín):     {diferida * 1000:8.2f} ms")
+    print(f"Ahorro por ejecución:     {(anticipada - diferida) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
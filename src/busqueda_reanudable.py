@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+
+class BusquedaReanudable:
+    def __init__(self, ruta, numeros, total_claves, clave_por_indice, descifrar, evaluador,
+                 inicio=0, fin=None, intervalo=10000):
+        """
+        Búsqueda exhaustiva sobre un espacio de claves enumerado por índice que guarda
+        periódicamente un punto de control en `ruta`. Si el archivo ya existe, la búsqueda
+        continúa exactamente desde donde se quedó.
+
+        El espacio [inicio, fin) permite repartir una búsqueda entre varias máquinas; los
+        resultados parciales se combinan con `fusionar`.
+
+        :param ruta: Ruta del archivo JSON del punto de control.
+        :param numeros: El texto cifrado como secuencia de posiciones en el alfabeto.
+        :param total_claves: Número total de claves del espacio.
+        :param clave_por_indice: Función que convierte un índice en una clave.
+        :param descifrar: Función descifrar(clave, fragmento, desplazamiento).
+        :param evaluador: EvaluadorCandidatos usado para puntuar.
+        :param inicio: Primer índice del rango a recorrer.
+        :param fin: Índice final (exclusivo) del rango; por defecto total_claves.
+        :param intervalo: Número de claves entre puntos de control.
+        """
+        self.ruta = ruta
+        self.numeros = numeros
+        self.clave_por_indice = clave_por_indice
+        self.descifrar = descifrar
+        self.evaluador = evaluador
+        self.intervalo = intervalo
+
+        fin = total_claves if fin is None else fin
+        if not 0 <= inicio <= fin <= total_claves:
+            raise ValueError(f"Rango de claves inválido: [{inicio}, {fin}) de {total_claves}.")
+
+        self.huella = BusquedaReanudable.calcular_huella(numeros, total_claves, evaluador)
+        self.estado = {
+            'huella': self.huella,
+            'total_claves': total_claves,
+            'inicio': inicio,
+            'fin': fin,
+            'cursor': inicio,
+            'mejores': [],
+        }
+        if os.path.exists(ruta):
+            self.cargar()
+
+    @staticmethod
+    def calcular_huella(numeros, total_claves, evaluador):
+        """
+        Identifica el texto, el modelo de puntuación y los parámetros de la búsqueda, para no
+        reanudar ni fusionar puntos de control de búsquedas distintas.
+        """
+        datos = bytes(numeros) + repr((total_claves, evaluador.k, evaluador.tam_muestra,
+                                       evaluador.tam_bloque, evaluador.por_letra,
+                                       evaluador.alfabeto, list(evaluador.tabla))).encode()
+        return hashlib.sha256(datos).hexdigest()
+
+    @staticmethod
+    def leer(ruta):
+        """
+        Lee un punto de control.
+
+        :param ruta: Ruta del archivo.
+        :return: Diccionario con el estado guardado.
+        """
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            return json.load(archivo)
+
+    def cargar(self):
+        """
+        Restaura el cursor y los mejores candidatos desde el punto de control.
+        """
+        estado = BusquedaReanudable.leer(self.ruta)
+        if estado['huella'] != self.huella:
+            raise ValueError(f"El punto de control {self.ruta} pertenece a otra búsqueda.")
+        if (estado['inicio'], estado['fin']) != (self.estado['inicio'], self.estado['fin']):
+            raise ValueError(f"El punto de control {self.ruta} cubre otro rango de claves.")
+
+        estado['mejores'] = [tuple(item) for item in estado['mejores']]
+        self.estado = estado
+
+    def guardar(self):
+        """
+        Escribe el punto de control de forma atómica: primero a un archivo temporal y luego
+        se reemplaza el anterior, así una interrupción nunca deja un archivo a medias.
+        """
+        temporal = self.ruta + '.tmp'
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            json.dump(self.estado, archivo)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, self.ruta)
+
+    def terminada(self):
+        """
+        Indica si ya se recorrió todo el rango de claves.
+        """
+        return self.estado['cursor'] >= self.estado['fin']
+
+    def ejecutar(self):
+        """
+        Recorre el rango de claves desde el cursor guardado, guardando un punto de control
+        cada `intervalo` claves.
+
+        :return: Lista de tuplas (puntaje, orden, clave) lista para `EvaluadorCandidatos.confirmar`.
+        """
+        def descifrar_indice(indice, fragmento, desplazamiento):
+            return self.descifrar(self.clave_por_indice(indice), fragmento, desplazamiento)
+
+        while not self.terminada():
+            cursor = self.estado['cursor']
+            siguiente = min(cursor + self.intervalo, self.estado['fin'])
+            self.estado['mejores'] = self.evaluador.puntuar_muestra(
+                self.numeros, range(cursor, siguiente), descifrar_indice, self.estado['mejores'])
+            self.estado['cursor'] = siguiente
+            self.guardar()
+
+        return self.mejores_claves(self.estado['mejores'])
+
+    def mejores_claves(self, mejores):
+        """
+        Convierte los índices guardados en los candidatos en sus claves.
+        """
+        return [(puntaje, orden, self.clave_por_indice(indice)) for puntaje, orden, indice in mejores]
+
+    @staticmethod
+    def fusionar(rutas, k, clave_por_indice, huella=None):
+        """
+        Combina los k mejores de varios puntos de control que cubren partes del mismo
+        espacio de claves (por ejemplo, uno por máquina). Los rangos deben estar terminados,
+        no traslaparse y cubrir juntos todo el espacio [0, total_claves).
+
+        :param rutas: Rutas de los puntos de control.
+        :param k: Número de candidatos a conservar.
+        :param clave_por_indice: Función que convierte un índice en una clave.
+        :param huella: Si se indica, los puntos de control deben pertenecer a esta búsqueda
+                       (ver `calcular_huella`).
+        :return: Lista de tuplas (puntaje, orden, clave) con los k mejores globales,
+                 lista para `EvaluadorCandidatos.confirmar`.
+        """
+        estados = [BusquedaReanudable.leer(ruta) for ruta in rutas]
+        if not estados:
+            raise ValueError("No hay puntos de control para fusionar.")
+        if len({estado['huella'] for estado in estados}) > 1:
+            raise ValueError("Los puntos de control pertenecen a búsquedas distintas.")
+        if huella is not None and estados[0]['huella'] != huella:
+            raise ValueError("Los puntos de control pertenecen a otra búsqueda.")
+        for ruta, estado in zip(rutas, estados):
+            if estado['cursor'] < estado['fin']:
+                raise ValueError(f"El punto de control {ruta} no ha terminado su rango.")
+
+        # Los rangos ordenados deben quedar uno a continuación del otro
+        cubierto = 0
+        for estado in sorted(estados, key=lambda estado: (estado['inicio'], estado['fin'])):
+            if estado['inicio'] < cubierto:
+                raise ValueError(f"Los rangos se traslapan en [{estado['inicio']}, {cubierto}).")
+            if estado['inicio'] > cubierto:
+                raise ValueError(f"Faltan las claves del rango [{cubierto}, {estado['inicio']}).")
+            cubierto = estado['fin']
+        if cubierto != estados[0]['total_claves']:
+            raise ValueError(f"Faltan las claves del rango [{cubierto}, {estados[0]['total_claves']}).")
+
+        # Los índices de clave son únicos en todo el espacio; se usan como orden para desempatar
+        candidatos = {indice: puntaje for estado in estados for puntaje, _, indice in estado['mejores']}
+        ordenados = sorted(candidatos.items(), key=lambda candidato: (-candidato[1], candidato[0]))
+        return [(puntaje, indice, clave_por_indice(indice)) for indice, puntaje in ordenados[:k]]
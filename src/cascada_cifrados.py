@@ -0,0 +1,107 @@
+import math
+import numpy as np
+from affine_cipher import CifradoAfin
+from mono_alf_cipher import CifradoMonoalfabeticoAleatorio
+from vigenere_cipher import CifradoVigenere
+from utils_cipher import UtilsCipher
+from utils_vectorizado import UtilsVectorizado
+
+class CascadaCifrados:
+    def __init__(self, etapas, bandera):
+        """
+        Inicializa una cascada de cifrados clásicos aplicados uno después de otro.
+        Todas las etapas son sustituciones letra a letra, así que se combinan en una sola
+        tabla por posición: las etapas sin periodo (afín, monoalfabético) se componen en
+        la misma tabla y las periódicas (Vigenère) se combinan con periodo igual al
+        mínimo común múltiplo de las longitudes de sus claves.
+        
+        :param etapas: Lista de etapas en orden de cifrado. Cada etapa es una tupla
+                       (CifradoAfin, a, b), (CifradoVigenere, clave) o
+                       (CifradoMonoalfabeticoAleatorio, clave).
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        """
+        self.bandera = bandera
+        self.alfabeto = CifradoAfin.obtener_alfabeto(bandera)
+        N = len(self.alfabeto)
+
+        tablas_etapas = [self.tabla_etapa(etapa) for etapa in etapas]
+        self.periodo = math.lcm(*(len(tabla) for tabla in tablas_etapas)) if tablas_etapas else 1
+
+        # tabla[j][x]: letra cifrada de x en una posición j (mod periodo)
+        posiciones = np.arange(self.periodo)
+        tabla = np.tile(np.arange(N, dtype=np.uint8), (self.periodo, 1))
+        for tabla_etapa in tablas_etapas:
+            tabla = tabla_etapa[(posiciones % len(tabla_etapa))[:, None], tabla]
+        self.tabla = tabla
+
+        # La tabla inversa de cada posición es la permutación inversa de su fila
+        self.tabla_inversa = np.argsort(tabla, axis=1).astype(np.uint8)
+
+    def tabla_etapa(self, etapa):
+        """
+        Construye la tabla de sustitución de una etapa.
+        
+        :param etapa: Tupla con la clase del cifrado y su clave.
+        :return: Arreglo uint8 de forma (periodo de la etapa, N).
+        """
+        cifrado, *clave = etapa
+        alfabeto = self.alfabeto
+        N = len(alfabeto)
+        x = np.arange(N)
+
+        if cifrado is CifradoAfin:
+            a, b = clave
+            if UtilsCipher.mod_inverse(a, N) is None:
+                raise ValueError(f"No existe inverso multiplicativo de {a} mod {N}")
+            return ((a * x + b) % N).astype(np.uint8)[None, :]
+
+        if cifrado is CifradoVigenere:
+            clave = CifradoVigenere.preprocesar_texto(clave[0], self.bandera)
+            if not clave:
+                raise ValueError("La clave de Vigenère no puede estar vacía.")
+            desplazamientos = UtilsVectorizado.codificar(clave, alfabeto).astype(np.int64)
+            return ((x[None, :] + desplazamientos[:, None]) % N).astype(np.uint8)
+
+        if cifrado is CifradoMonoalfabeticoAleatorio:
+            if self.bandera != 'en':
+                raise ValueError("El cifrado monoalfabético solo usa el alfabeto inglés, se requiere bandera 'en'.")
+            clave = clave[0]
+            if sorted(clave) != list(alfabeto):
+                raise ValueError("La clave monoalfabética debe ser una permutación de las 26 letras.")
+            return UtilsVectorizado.codificar(clave, alfabeto)[None, :]
+
+        raise ValueError(f"Etapa no soportada en la cascada: {cifrado}")
+
+    def aplicar(self, texto, tabla):
+        """
+        Aplica una tabla por posición a todo el texto en una sola pasada vectorizada.
+        
+        :param texto: El texto a transformar.
+        :param tabla: Tabla de forma (periodo, N).
+        :return: El texto transformado en bloques de 10 letras.
+        """
+        texto = CifradoAfin.preprocesar_texto(texto, self.bandera)
+        numeros = UtilsVectorizado.codificar(texto, self.alfabeto)
+        posiciones = np.arange(len(numeros)) % self.periodo
+        resultado = UtilsVectorizado.decodificar(tabla[posiciones, numeros], self.alfabeto)
+
+        # Dividir en bloques de 10 letras
+        return UtilsVectorizado.dividir_en_bloques(resultado)
+
+    def cifrar(self, texto):
+        """
+        Cifra el texto con todas las etapas de la cascada.
+        
+        :param texto: El texto a cifrar.
+        :return: El texto cifrado en bloques de 10 letras.
+        """
+        return self.aplicar(texto, self.tabla)
+
+    def descifrar(self, texto_cifrado):
+        """
+        Descifra el texto deshaciendo todas las etapas de la cascada.
+        
+        :param texto_cifrado: El texto cifrado.
+        :return: El texto descifrado en bloques de 10 letras.
+        """
+        return self.aplicar(texto_cifrado, self.tabla_inversa)
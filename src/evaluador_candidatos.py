@@ -0,0 +1,148 @@
+import heapq
+from utils_cipher import UtilsCipher
+
+class EvaluadorCandidatos:
+    def __init__(self, alfabeto, bandera, k=5, tam_muestra=300, tam_bloque=50, tabla=None,
+                 por_letra=False):
+        """
+        Inicializa un evaluador de claves candidatas para búsquedas exhaustivas.
+        Cada candidato se puntúa primero sobre una muestra pequeña del texto cifrado,
+        se conserva un montículo con los k mejores y solo esos se descifran completos.
+
+        :param alfabeto: El alfabeto del cifrado.
+        :param bandera: 'es' para español, 'en' para inglés.
+        :param k: Número de candidatos a conservar.
+        :param tam_muestra: Número de letras del texto cifrado usadas para la puntuación inicial.
+        :param tam_bloque: Número de letras que se descifran antes de intentar descartar un candidato.
+                           Debe ser múltiplo del tamaño de bloque del cifrado (por ejemplo 2 para Hill).
+        :param tabla: Tabla opcional de log-probabilidades indexada por posición en el alfabeto.
+        :param por_letra: True si el cifrado sustituye cada letra cifrada siempre por la misma
+                          letra clara sin importar su posición (afín, monoalfabético). Entonces
+                          cada candidato se puntúa descifrando solo las letras distintas del
+                          texto, ponderadas por sus conteos, con una cota más ajustada.
+        """
+        if k < 1:
+            raise ValueError("k debe ser al menos 1.")
+        self.alfabeto = alfabeto
+        self.k = k
+        self.tam_muestra = tam_muestra
+        self.tam_bloque = tam_bloque
+        self.tabla = tabla if tabla is not None else UtilsCipher.log_frecuencias(alfabeto, bandera)
+        self.maximo_por_letra = max(self.tabla)
+        self.por_letra = por_letra
+
+    def preparar_pasos(self, numeros):
+        """
+        Divide el trabajo de puntuar un candidato en pasos. Después de cada paso se compara
+        el puntaje parcial más una cota de lo que falta contra el umbral de los k mejores.
+
+        Sin `por_letra`, cada paso descifra un bloque de la muestra y la cota supone la letra
+        más probable en cada posición restante.
+
+        Con `por_letra`, el puntaje sobre el texto completo es sum(conteo[c] * tabla[d(c)]),
+        así que basta descifrar cada letra distinta una vez. Las letras se descifran de la
+        más a la menos frecuente y, como las restantes se descifran con la misma permutación,
+        su puntaje no supera el de emparejar sus conteos con las letras más probables del
+        idioma (desigualdad de reordenamiento).
+
+        :param numeros: El texto cifrado como secuencia de posiciones en el alfabeto.
+        :return: Lista de tuplas (fragmento, desplazamiento, pesos, cota de lo que falta);
+                 pesos es None cuando cada letra cuenta una vez.
+        """
+        if not self.por_letra:
+            muestra = numeros[:self.tam_muestra]
+            longitud = len(muestra)
+            pasos = []
+            for inicio in range(0, longitud, self.tam_bloque):
+                fin = min(inicio + self.tam_bloque, longitud)
+                pasos.append((muestra[inicio:fin], inicio, None, (longitud - fin) * self.maximo_por_letra))
+            return pasos
+
+        conteos = [0] * len(self.tabla)
+        for x in numeros:
+            conteos[x] += 1
+        letras = sorted((c for c in range(len(conteos)) if conteos[c] > 0), key=lambda c: -conteos[c])
+        tabla_ordenada = sorted(self.tabla, reverse=True)
+
+        # Las letras se descifran de a pocas: el grueso del puntaje está en las más frecuentes
+        tam_paso = 3
+        pasos = []
+        for inicio in range(0, len(letras), tam_paso):
+            fragmento = letras[inicio:inicio + tam_paso]
+            restantes = letras[inicio + tam_paso:]
+            cota = sum(conteos[c] * p for c, p in zip(restantes, tabla_ordenada))
+            pasos.append((fragmento, 0, [conteos[c] for c in fragmento], cota))
+        return pasos
+
+    def puntuar_muestra(self, numeros, candidatos, descifrar, mejores=None):
+        """
+        Puntúa cada candidato y conserva los k mejores. Un candidato se descarta en cuanto
+        su cota superior (puntaje parcial más una cota de lo que falta, ver `preparar_pasos`)
+        no alcanza al peor de los k mejores.
+
+        :param numeros: El texto cifrado como secuencia de posiciones en el alfabeto.
+        :param candidatos: Iterable de claves a probar.
+        :param descifrar: Función descifrar(clave, fragmento, desplazamiento) que devuelve las
+                          posiciones descifradas de un fragmento que empieza en `desplazamiento`.
+        :param mejores: Montículo previo de (puntaje, orden, clave) a continuar, o None.
+        :return: Montículo de tuplas (puntaje, orden, clave) con a lo más k elementos.
+        """
+        mejores = [] if mejores is None else mejores
+        tabla = self.tabla
+        pasos = self.preparar_pasos(numeros)
+        # El orden desempata candidatos con el mismo puntaje sin comparar las claves
+        orden = max(item[1] for item in mejores) + 1 if mejores else 0
+
+        for clave in candidatos:
+            parcial = 0.0
+            descartado = False
+            for fragmento, desplazamiento, pesos, cota in pasos:
+                descifrado = descifrar(clave, fragmento, desplazamiento)
+                if pesos is None:
+                    parcial += sum(tabla[x] for x in descifrado)
+                else:
+                    parcial += sum(peso * tabla[x] for peso, x in zip(pesos, descifrado))
+                if len(mejores) == self.k and parcial + cota <= mejores[0][0]:
+                    descartado = True
+                    break
+
+            if not descartado:
+                if len(mejores) < self.k:
+                    heapq.heappush(mejores, (parcial, orden, clave))
+                else:
+                    heapq.heappushpop(mejores, (parcial, orden, clave))
+            orden += 1
+
+        return mejores
+
+    def confirmar(self, numeros, mejores, descifrar):
+        """
+        Descifra el texto completo solo para los candidatos sobrevivientes y los ordena
+        por su puntaje promedio por letra sobre el texto completo.
+
+        :param numeros: El texto cifrado como secuencia de posiciones en el alfabeto.
+        :param mejores: Montículo de (puntaje, orden, clave) devuelto por `puntuar_muestra`.
+        :param descifrar: La misma función usada en `puntuar_muestra`.
+        :return: Lista de tuplas (puntaje, clave, texto_descifrado) de mayor a menor puntaje.
+        """
+        resultados = []
+        for _, _, clave in mejores:
+            descifrado = descifrar(clave, numeros, 0)
+            puntaje = sum(self.tabla[x] for x in descifrado) / max(len(descifrado), 1)
+            resultados.append((puntaje, clave, UtilsCipher.numeros_a_texto(descifrado, self.alfabeto)))
+
+        resultados.sort(key=lambda resultado: resultado[0], reverse=True)
+        return resultados
+
+    def evaluar(self, numeros, candidatos, descifrar):
+        """
+        Evalúa todos los candidatos: puntuación sobre la muestra con poda y confirmación
+        de los k mejores sobre el texto completo.
+
+        :param numeros: El texto cifrado como secuencia de posiciones en el alfabeto.
+        :param candidatos: Iterable de claves a probar.
+        :param descifrar: Función descifrar(clave, fragmento, desplazamiento).
+        :return: Lista de tuplas (puntaje, clave, texto_descifrado) de mayor a menor puntaje.
+        """
+        mejores = self.puntuar_muestra(numeros, candidatos, descifrar)
+        return self.confirmar(numeros, mejores, descifrar)
@@ -1,8 +1,11 @@
 import numpy as np
 from utils_cipher import UtilsCipher
+from utils_vectorizado import UtilsVectorizado
 import unicodedata
 
 class HillCipher:
+    alphabet = 'ABCDEFGHIJKLMNÑOPQRSTUVWXYZ'
+
     def __init__(self, key_matrix):
         """
         Inicializa el cifrado de Hill con una matriz clave de 2x2.
@@ -83,28 +86,50 @@ class HillCipher:
         # Matriz inversa = adjunta * inverso del determinante (mod modulus)
         return (det_inv * adjugate_matrix) % modulus
 
+    def apply_matrix(self, numbers, matrix):
+        """
+        Aplica la matriz a todos los bloques de 2 letras a la vez.
+        
+        :param numbers: Buffer uint8 de longitud par con las posiciones de las letras.
+        :param matrix: Matriz 2x2 a aplicar.
+        :return: Buffer uint8 con el resultado, de la misma longitud.
+        """
+        # Con la matriz reducida módulo 27, cada producto cabe en uint16 (2 * 26 * 26 < 2^16)
+        matrix = (np.asarray(matrix) % self.modulus).astype(np.uint16)
+        blocks = numbers.reshape(-1, 2)
+        result = np.empty_like(numbers)
+        product = np.empty(len(blocks), dtype=np.uint16)
+        total = np.empty(len(blocks), dtype=np.uint16)
+
+        # Cada salida i del bloque (x1, x2) es M[i][0] * x1 + M[i][1] * x2 (mod 27)
+        for i in range(2):
+            np.multiply(blocks[:, 0], matrix[i, 0], out=total)
+            np.multiply(blocks[:, 1], matrix[i, 1], out=product)
+            np.add(total, product, out=total)
+            np.remainder(total, self.modulus, out=total)
+            result[i::2] = total
+        return result
+
     def encrypt(self, plaintext):
         """
         Cifra el texto claro utilizando el cifrado de Hill con matriz clave 2x2.
+        El texto se mantiene de principio a fin en un solo buffer uint8.
         
         :param plaintext: El texto claro.
         :return: El texto cifrado.
         """
         plaintext = self.preprocesar_texto(plaintext)
-        plaintext_numbers = self.text_to_numbers(plaintext)
+        plaintext_numbers = UtilsVectorizado.codificar(plaintext, self.alphabet)
 
         # Añadir padding si es necesario para que la longitud sea múltiplo de 2
-        if len(plaintext_numbers) % 2 != 0:
-            plaintext_numbers.append(24)  # Padding con X (que corresponde a 0)
+        length = len(plaintext_numbers)
+        padded = np.full(length + length % 2, 24, dtype=np.uint8)  # Padding con X (que corresponde a 24)
+        padded[:length] = plaintext_numbers
 
-        # Dividir el texto en bloques de tamaño 2 y cifrar cada bloque
-        ciphertext_numbers = []
-        for i in range(0, len(plaintext_numbers), 2):
-            block = np.array(plaintext_numbers[i:i + 2])
-            cipher_block = np.dot(self.key_matrix, block) % self.modulus
-            ciphertext_numbers.extend(cipher_block)
+        # Cifrar todos los bloques de tamaño 2
+        ciphertext_numbers = self.apply_matrix(padded, self.key_matrix)
 
-        return self.numbers_to_text(ciphertext_numbers)
+        return UtilsVectorizado.decodificar(ciphertext_numbers, self.alphabet)
 
     def decrypt(self, ciphertext):
         """
@@ -114,16 +139,14 @@ class HillCipher:
         :return: El texto claro.
         """
         ciphertext = self.preprocesar_texto(ciphertext)
-        ciphertext_numbers = self.text_to_numbers(ciphertext)
+        ciphertext_numbers = UtilsVectorizado.codificar(ciphertext, self.alphabet)
+        if len(ciphertext_numbers) % 2 != 0:
+            raise ValueError("La longitud del texto cifrado debe ser múltiplo de 2.")
 
         # Calcular la inversa de la matriz clave en Z27
         key_matrix_inv = self.mod_inverse_matrix(self.key_matrix, self.modulus)
 
-        # Dividir el texto en bloques de tamaño 2 y descifrar cada bloque
-        plaintext_numbers = []
-        for i in range(0, len(ciphertext_numbers), 2):
-            block = np.array(ciphertext_numbers[i:i + 2])
-            plain_block = np.dot(key_matrix_inv, block) % self.modulus
-            plaintext_numbers.extend(plain_block)
+        # Descifrar todos los bloques de tamaño 2
+        plaintext_numbers = self.apply_matrix(ciphertext_numbers, key_matrix_inv)
 
-        return self.numbers_to_text(plaintext_numbers)
+        return UtilsVectorizado.decodificar(plaintext_numbers, self.alphabet)
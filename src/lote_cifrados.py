@@ -0,0 +1,202 @@
+import numpy as np
+from affine_cipher import CifradoAfin
+from mono_alf_cipher import CifradoMonoalfabeticoAleatorio
+from utils_cipher import UtilsCipher
+from utils_vectorizado import UtilsVectorizado
+from vigenere_cipher import CifradoVigenere
+
+class LoteMensajes:
+    def __init__(self, numeros, desplazamientos, alfabeto):
+        """
+        Conjunto de mensajes empaquetados en un solo buffer de posiciones en el alfabeto.
+        El mensaje i ocupa numeros[desplazamientos[i]:desplazamientos[i + 1]]; cada mensaje
+        se convierte a texto solo cuando se pide.
+
+        :param numeros: Arreglo uint8 con todos los mensajes concatenados.
+        :param desplazamientos: Arreglo con el inicio de cada mensaje y el final del último.
+        :param alfabeto: El alfabeto de las posiciones.
+        """
+        self.numeros = numeros
+        self.desplazamientos = desplazamientos
+        self.alfabeto = alfabeto
+
+    def __len__(self):
+        return len(self.desplazamientos) - 1
+
+    def __getitem__(self, indice):
+        """
+        Obtiene el texto del mensaje `indice`, sin dividir en bloques.
+        """
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de mensaje fuera de rango.")
+        inicio, fin = self.desplazamientos[indice], self.desplazamientos[indice + 1]
+        return UtilsVectorizado.decodificar(self.numeros[inicio:fin], self.alfabeto)
+
+    def __iter__(self):
+        for indice in range(len(self)):
+            yield self[indice]
+
+
+class CifradoPorLotes:
+    @staticmethod
+    def empaquetar(mensajes, bandera, preprocesar):
+        """
+        Preprocesa los mensajes y los concatena en un solo buffer codificado.
+
+        :param mensajes: Secuencia de textos.
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        :param preprocesar: Función de preprocesamiento del cifrado.
+        :return: Tupla (numeros, desplazamientos, mensaje_por_letra).
+        """
+        textos = [preprocesar(mensaje) for mensaje in mensajes]
+        longitudes = np.array([len(texto) for texto in textos], dtype=np.int64)
+        desplazamientos = np.zeros(len(textos) + 1, dtype=np.int64)
+        np.cumsum(longitudes, out=desplazamientos[1:])
+
+        alfabeto = CifradoAfin.obtener_alfabeto(bandera)
+        numeros = UtilsVectorizado.codificar(''.join(textos), alfabeto)
+        mensaje_por_letra = np.repeat(np.arange(len(textos)), longitudes)
+        return numeros, desplazamientos, mensaje_por_letra
+
+    @staticmethod
+    def aplicar_tablas(pares, bandera, preprocesar, tabla_clave):
+        """
+        Aplica a cada mensaje su propia tabla de sustitución en una sola pasada vectorizada.
+
+        :param pares: Secuencia de tuplas (mensaje, clave).
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        :param preprocesar: Función de preprocesamiento del cifrado.
+        :param tabla_clave: Función que convierte una clave en su tabla de N posiciones.
+        :return: LoteMensajes con los resultados.
+        """
+        mensajes = [mensaje for mensaje, _ in pares]
+        alfabeto = CifradoAfin.obtener_alfabeto(bandera)
+        numeros, desplazamientos, mensaje_por_letra = CifradoPorLotes.empaquetar(mensajes, bandera, preprocesar)
+
+        # tablas[i][x]: sustitución de la letra x en el mensaje i
+        tablas = np.array([tabla_clave(clave) for _, clave in pares], dtype=np.uint8).reshape(len(pares), len(alfabeto))
+        return LoteMensajes(tablas[mensaje_por_letra, numeros], desplazamientos, alfabeto)
+
+    @staticmethod
+    def tabla_afin(clave, N, inversa):
+        """
+        Tabla de sustitución de una clave afín (a, b).
+        """
+        a, b = clave
+        x = np.arange(N)
+        if not inversa:
+            return (a * x + b) % N
+        a_inv = UtilsCipher.mod_inverse(a, N)
+        if a_inv is None:
+            raise ValueError(f"No existe inverso multiplicativo de {a} mod {N}")
+        return a_inv * (x - b) % N
+
+    @staticmethod
+    def cifrar_afin(pares, bandera):
+        """
+        Cifra muchos mensajes con el cifrado afín, cada uno con su clave.
+
+        :param pares: Secuencia de tuplas (mensaje, (a, b)).
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        :return: LoteMensajes con los textos cifrados.
+        """
+        N = len(CifradoAfin.obtener_alfabeto(bandera))
+        return CifradoPorLotes.aplicar_tablas(pares, bandera,
+                                              lambda texto: CifradoAfin.preprocesar_texto(texto, bandera),
+                                              lambda clave: CifradoPorLotes.tabla_afin(clave, N, False))
+
+    @staticmethod
+    def descifrar_afin(pares, bandera):
+        """
+        Descifra muchos mensajes con el cifrado afín, cada uno con su clave.
+
+        :param pares: Secuencia de tuplas (mensaje, (a, b)).
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        :return: LoteMensajes con los textos descifrados.
+        """
+        N = len(CifradoAfin.obtener_alfabeto(bandera))
+        return CifradoPorLotes.aplicar_tablas(pares, bandera,
+                                              lambda texto: CifradoAfin.preprocesar_texto(texto, bandera),
+                                              lambda clave: CifradoPorLotes.tabla_afin(clave, N, True))
+
+    @staticmethod
+    def tabla_monoalfabetica(clave, alfabeto):
+        """
+        Tabla de sustitución de una clave monoalfabética; la clave debe ser una permutación del alfabeto.
+        """
+        if sorted(clave) != list(alfabeto):
+            raise ValueError("La clave monoalfabética debe ser una permutación de las 26 letras.")
+        return UtilsVectorizado.codificar(clave, alfabeto)
+
+    @staticmethod
+    def cifrar_monoalfabetico(pares):
+        """
+        Cifra muchos mensajes con el cifrado monoalfabético, cada uno con su clave.
+
+        :param pares: Secuencia de tuplas (mensaje, clave de 26 letras).
+        :return: LoteMensajes con los textos cifrados.
+        """
+        alfabeto = CifradoAfin.obtener_alfabeto('en')
+        return CifradoPorLotes.aplicar_tablas(pares, 'en', CifradoMonoalfabeticoAleatorio.preprocesar_texto,
+                                              lambda clave: CifradoPorLotes.tabla_monoalfabetica(clave, alfabeto))
+
+    @staticmethod
+    def descifrar_monoalfabetico(pares):
+        """
+        Descifra muchos mensajes con el cifrado monoalfabético, cada uno con su clave.
+
+        :param pares: Secuencia de tuplas (mensaje, clave de 26 letras).
+        :return: LoteMensajes con los textos descifrados.
+        """
+        alfabeto = CifradoAfin.obtener_alfabeto('en')
+        return CifradoPorLotes.aplicar_tablas(pares, 'en', CifradoMonoalfabeticoAleatorio.preprocesar_texto,
+                                              lambda clave: np.argsort(CifradoPorLotes.tabla_monoalfabetica(clave, alfabeto)))
+
+    @staticmethod
+    def vigenere(pares, bandera, signo):
+        """
+        Aplica el cifrado (signo=1) o descifrado (signo=-1) Vigenère a muchos mensajes.
+        Las claves se concatenan en un solo buffer; cada letra toma el desplazamiento
+        clave[posición dentro de su mensaje mod longitud de su clave].
+        """
+        alfabeto = CifradoVigenere.obtener_alfabeto(bandera)
+        N = len(alfabeto)
+        mensajes = [mensaje for mensaje, _ in pares]
+        numeros, desplazamientos, mensaje_por_letra = CifradoPorLotes.empaquetar(
+            mensajes, bandera, lambda texto: CifradoVigenere.preprocesar_texto(texto, bandera))
+
+        claves = [CifradoVigenere.preprocesar_texto(clave, bandera) for _, clave in pares]
+        if not all(claves):
+            raise ValueError("La clave de Vigenère no puede estar vacía.")
+        longitudes_clave = np.array([len(clave) for clave in claves], dtype=np.int64)
+        inicios_clave = np.concatenate(([0], np.cumsum(longitudes_clave)[:-1]))
+        numeros_claves = UtilsVectorizado.codificar(''.join(claves), alfabeto).astype(np.int64)
+
+        posicion = np.arange(len(numeros)) - desplazamientos[mensaje_por_letra]
+        indice_clave = inicios_clave[mensaje_por_letra] + posicion % longitudes_clave[mensaje_por_letra]
+        resultado = (numeros + signo * numeros_claves[indice_clave]) % N
+        return LoteMensajes(resultado.astype(np.uint8), desplazamientos, alfabeto)
+
+    @staticmethod
+    def cifrar_vigenere(pares, bandera):
+        """
+        Cifra muchos mensajes con el cifrado Vigenère, cada uno con su clave.
+
+        :param pares: Secuencia de tuplas (mensaje, clave).
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        :return: LoteMensajes con los textos cifrados.
+        """
+        return CifradoPorLotes.vigenere(pares, bandera, 1)
+
+    @staticmethod
+    def descifrar_vigenere(pares, bandera):
+        """
+        Descifra muchos mensajes con el cifrado Vigenère, cada uno con su clave.
+
+        :param pares: Secuencia de tuplas (mensaje, clave).
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        :return: LoteMensajes con los textos descifrados.
+        """
+        return CifradoPorLotes.vigenere(pares, bandera, -1)
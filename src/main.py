@@ -1,11 +1,5 @@
 import os
-from utils_cipher import UtilsCipher
-from mono_alf_cipher import CifradoMonoalfabeticoAleatorio
-from vigenere_cipher import CifradoVigenere
-from affine_cipher import CifradoAfin
-from hill_cipher import HillCipher
-from playfair_cipher import PlayfairCipher
-import random
+from registro_cifrados import RegistroCifrados
 
 def leer_archivo(ruta_archivo):
     if not os.path.exists(ruta_archivo):
@@ -25,6 +19,7 @@ def main():
 
     ruta_archivo_salida = 'docs/Texto1_descifrado_playfair.txt'
 
+    PlayfairCipher = RegistroCifrados.obtener('playfair')
     cipher = PlayfairCipher()
     plaintext = cipher.descifrar(texto)
 
@@ -0,0 +1,168 @@
+from utils_cipher import UtilsCipher
+from vigenere_cipher import CifradoVigenere
+
+class PerfilDeslizante:
+    def __init__(self, bandera='en'):
+        """
+        Inicializa el perfil con el alfabeto y la distribución de frecuencias del idioma.
+
+        :param bandera: 'es' para español (alfabeto con Ñ), 'en' para inglés (sin Ñ).
+        """
+        self.bandera = bandera
+        self.alfabeto = CifradoVigenere.obtener_alfabeto(bandera)
+        self.probabilidades = [10 ** log_p for log_p in UtilsCipher.log_frecuencias(self.alfabeto, bandera)]
+
+    def preprocesar(self, texto):
+        """
+        Preprocesa el texto igual que el cifrado Vigenère y lo convierte a posiciones en el alfabeto.
+        Las posiciones de las fronteras se refieren a este texto preprocesado.
+
+        :param texto: El texto a analizar.
+        :return: Lista de posiciones en el alfabeto.
+        """
+        texto = CifradoVigenere.preprocesar_texto(texto, self.bandera)
+        # Se ignoran letras fuera del alfabeto (por ejemplo símbolos matemáticos Unicode)
+        texto = ''.join(letra for letra in texto if letra in self.alfabeto)
+        return UtilsCipher.texto_a_numeros(texto, self.alfabeto)
+
+    def ventana_vacia(self):
+        """
+        Crea el estado de una ventana: conteos, suma de f*(f-1), suma de f^2/p y longitud.
+        """
+        return [[0] * len(self.alfabeto), 0, 0.0, 0]
+
+    def agregar(self, ventana, letra):
+        """
+        Agrega una letra a la ventana actualizando las sumas en O(1).
+        """
+        conteos = ventana[0]
+        f = conteos[letra]
+        ventana[1] += 2 * f                                       # (f+1)f - f(f-1)
+        ventana[2] += (2 * f + 1) / self.probabilidades[letra]    # (f+1)^2 - f^2
+        ventana[3] += 1
+        conteos[letra] = f + 1
+
+    def quitar(self, ventana, letra):
+        """
+        Quita una letra de la ventana actualizando las sumas en O(1).
+        """
+        conteos = ventana[0]
+        f = conteos[letra] - 1
+        ventana[1] -= 2 * f
+        ventana[2] -= (2 * f + 1) / self.probabilidades[letra]
+        ventana[3] -= 1
+        conteos[letra] = f
+
+    @staticmethod
+    def estadisticos(ventana):
+        """
+        Calcula el índice de coincidencia y el chi-cuadrado contra el idioma de una ventana.
+        Chi-cuadrado = sum((f - n*p)^2 / (n*p)) = sum(f^2/p) / n - n.
+
+        :param ventana: Estado de la ventana.
+        :return: Tupla (ic, chi_cuadrado).
+        """
+        _, suma_ic, suma_chi, n = ventana
+        ic = suma_ic / (n * (n - 1)) if n > 1 else 0
+        chi_cuadrado = suma_chi / n - n if n > 0 else 0
+        return ic, chi_cuadrado
+
+    def perfil(self, numeros, tam_ventana, paso=1):
+        """
+        Recorre el texto con una ventana deslizante y calcula el índice de coincidencia y el
+        chi-cuadrado de cada ventana. Cada avance actualiza los conteos en O(1) en lugar
+        de volver a contar la ventana.
+
+        :param numeros: El texto como posiciones en el alfabeto (ver `preprocesar`).
+        :param tam_ventana: Número de letras de cada ventana.
+        :param paso: Cada cuántas posiciones se reporta una ventana.
+        :return: Generador de tuplas (inicio, ic, chi_cuadrado).
+        """
+        ventana = self.ventana_vacia()
+        for letra in numeros[:tam_ventana]:
+            self.agregar(ventana, letra)
+
+        for inicio in range(0, len(numeros) - tam_ventana + 1):
+            if inicio > 0:
+                self.quitar(ventana, numeros[inicio - 1])
+                self.agregar(ventana, numeros[inicio + tam_ventana - 1])
+            if inicio % paso == 0:
+                ic, chi_cuadrado = self.estadisticos(ventana)
+                yield inicio, ic, chi_cuadrado
+
+    @staticmethod
+    def termino_comparacion(izquierda, derecha, letra):
+        """
+        Término de una letra en el chi-cuadrado de dos muestras: (l - r)^2 / (l + r).
+        """
+        l = izquierda[0][letra]
+        r = derecha[0][letra]
+        return (l - r) ** 2 / (l + r) if l + r > 0 else 0.0
+
+    def detectar_cambios(self, numeros, tam_ventana, umbral_ic=0.02, umbral_chi=60.0):
+        """
+        Detecta fronteras donde cambia la clave o el cifrado comparando, en cada posición,
+        la ventana a su izquierda con la ventana a su derecha. Se comparan el índice de
+        coincidencia de ambas ventanas y sus distribuciones de letras mediante el
+        chi-cuadrado de dos muestras, que sí distingue dos sustituciones con igual índice.
+        Ambos se actualizan en O(1) por posición. Entre candidatas a menos de una ventana
+        de distancia se conserva la de mayor diferencia.
+
+        :param numeros: El texto como posiciones en el alfabeto (ver `preprocesar`).
+        :param tam_ventana: Número de letras de cada una de las dos ventanas.
+        :param umbral_ic: Diferencia mínima de índice de coincidencia.
+        :param umbral_chi: Valor mínimo del chi-cuadrado entre las dos ventanas.
+        :return: Lista ordenada de posiciones donde empieza un nuevo segmento.
+        """
+        izquierda = self.ventana_vacia()
+        derecha = self.ventana_vacia()
+        for letra in numeros[:tam_ventana]:
+            self.agregar(izquierda, letra)
+        for letra in numeros[tam_ventana:2 * tam_ventana]:
+            self.agregar(derecha, letra)
+        chi_ventanas = sum(self.termino_comparacion(izquierda, derecha, letra)
+                           for letra in range(len(self.alfabeto)))
+
+        fronteras = []  # Lista de (posicion, puntaje)
+        for posicion in range(tam_ventana, len(numeros) - tam_ventana + 1):
+            if posicion > tam_ventana:
+                sale = numeros[posicion - tam_ventana - 1]
+                cruza = numeros[posicion - 1]
+                entra = numeros[posicion + tam_ventana - 1]
+                afectadas = {sale, cruza, entra}
+                chi_ventanas -= sum(self.termino_comparacion(izquierda, derecha, letra) for letra in afectadas)
+
+                # La letra que cruza la frontera pasa de la ventana derecha a la izquierda
+                self.quitar(izquierda, sale)
+                self.agregar(izquierda, cruza)
+                self.quitar(derecha, cruza)
+                self.agregar(derecha, entra)
+                chi_ventanas += sum(self.termino_comparacion(izquierda, derecha, letra) for letra in afectadas)
+
+            ic_izq, _ = self.estadisticos(izquierda)
+            ic_der, _ = self.estadisticos(derecha)
+            puntaje = max(abs(ic_izq - ic_der) / umbral_ic, chi_ventanas / umbral_chi)
+            if puntaje < 1:
+                continue
+
+            # Supresión de no máximos: una sola frontera por ventana
+            if fronteras and posicion - fronteras[-1][0] < tam_ventana:
+                if puntaje > fronteras[-1][1]:
+                    fronteras[-1] = (posicion, puntaje)
+            else:
+                fronteras.append((posicion, puntaje))
+
+        return [posicion for posicion, _ in fronteras]
+
+    @staticmethod
+    def dividir_en_segmentos(texto, fronteras):
+        """
+        Divide un texto preprocesado en segmentos según las fronteras detectadas,
+        para romper cada segmento por separado.
+
+        :param texto: El texto preprocesado (o su lista de posiciones).
+        :param fronteras: Posiciones devueltas por `detectar_cambios`.
+        :return: Lista de segmentos.
+        """
+        limites = [0] + list(fronteras) + [len(texto)]
+        return [texto[limites[i]:limites[i + 1]] for i in range(len(limites) - 1)]
@@ -1,5 +1,8 @@
 import re
 
+# Número de dígrafos que se traducen por tramo al escribir el resultado
+TAM_TRAMO = 4096
+
 class PlayfairCipher:
     def __init__(self):
         # Definimos la matriz de Playfair proporcionada
@@ -10,29 +13,77 @@ class PlayfairCipher:
             ['N', 'V', 'R', 'G', 'P'],
             ['X', 'O', 'H', 'Q', 'Y']  # 'W' treated as 'X'
         ]
-    
-    def preprocesar_texto(self, texto):
+        # Tablas de dígrafos por sentido, se construyen la primera vez que se usan
+        self.tablas = {}
+
+    def preprocesar_bytes(self, texto):
         """
-        Preprocesa el texto eliminando signos de puntuación, cambiando Ñ por N, W por X, y eliminando espacios.
+        Preprocesa el texto y lo devuelve como un solo bytearray ASCII, un byte por letra.
+        Las 'X' de relleno se planean antes de copiar: se localizan las letras repetidas
+        consecutivas y cada tramo entre ellas se copia a un buffer reservado de antemano
+        con la longitud final y lleno de 'X'.
         """
         # Eliminar signos de puntuación y convertir a mayúsculas
         texto = re.sub(r'[^A-ZÑ]', '', texto.upper())  # Mantener solo letras mayúsculas y Ñ
         texto = texto.replace('Ñ', 'N').replace('W', 'X')  # Tratar Ñ como N, W como X
-        
+        letras = texto.encode('ascii')
+
         # Añadir 'X' entre letras repetidas en un dígrafo (por ejemplo, "AA" -> "AXA")
-        texto_procesado = ''
-        i = 0
-        while i < len(texto):
-            texto_procesado += texto[i]
-            if i + 1 < len(texto) and texto[i] == texto[i + 1]:
-                texto_procesado += 'X'
-            i += 1
+        repetidas = [coincidencia.start() for coincidencia in re.finditer(rb'(.)(?=\1)', letras)]
+        longitud = len(letras) + len(repetidas)
 
         # Si la longitud es impar, añadir 'X' al final
-        if len(texto_procesado) % 2 != 0:
-            texto_procesado += 'X'
-        
+        texto_procesado = bytearray(b'X') * (longitud + longitud % 2)
+        origen = destino = 0
+        for posicion in repetidas:
+            fin = posicion + 1
+            texto_procesado[destino:destino + fin - origen] = letras[origen:fin]
+            destino += fin - origen + 1  # Se deja la 'X' ya escrita
+            origen = fin
+        texto_procesado[destino:destino + len(letras) - origen] = letras[origen:]
         return texto_procesado
+
+    def preprocesar_texto(self, texto):
+        """
+        Preprocesa el texto eliminando signos de puntuación, cambiando Ñ por N, W por X, y eliminando espacios.
+        """
+        return self.preprocesar_bytes(texto).decode('ascii')
+
+    def tabla_digramas(self, sentido):
+        """
+        Tabla con el resultado de cada dígrafo de la matriz, indexada por (letra1 << 7) | letra2.
+
+        :param sentido: 1 para cifrar, -1 para descifrar.
+        :return: Lista de 2^14 entradas; las de letras fuera de la matriz son None.
+        """
+        if sentido not in self.tablas:
+            transformar_digrama = self.cifrar_digrama if sentido == 1 else self.descifrar_digrama
+            letras = [letra for fila in self.matriz for letra in fila]
+            tabla = [None] * (1 << 14)
+            for letra1 in letras:
+                for letra2 in letras:
+                    tabla[(ord(letra1) << 7) | ord(letra2)] = transformar_digrama(letra1, letra2).encode('ascii')
+            self.tablas[sentido] = tabla
+        return self.tablas[sentido]
+
+    def transformar(self, texto, sentido):
+        """
+        Aplica las reglas de Playfair a todos los dígrafos con una tabla precalculada,
+        escribiendo el resultado por tramos en un buffer de la misma longitud.
+        
+        :param texto: El texto a transformar.
+        :param sentido: 1 para cifrar, -1 para descifrar.
+        :return: El texto transformado.
+        """
+        letras = self.preprocesar_bytes(texto)
+        tabla = self.tabla_digramas(sentido)
+        resultado = bytearray(len(letras))
+        paso = 2 * TAM_TRAMO
+        for inicio in range(0, len(letras), paso):
+            tramo = letras[inicio:inicio + paso]
+            resultado[inicio:inicio + len(tramo)] = b''.join(
+                [tabla[(letra1 << 7) | letra2] for letra1, letra2 in zip(tramo[0::2], tramo[1::2])])
+        return resultado.decode('ascii')
     
     def obtener_posicion(self, letra):
         """
@@ -68,15 +119,7 @@ class PlayfairCipher:
         """
         Cifra el texto usando el cifrado Playfair.
         """
-        texto = self.preprocesar_texto(texto)
-        criptotexto = ''
-
-        # Dividir el texto en dígrafos
-        for i in range(0, len(texto), 2):
-            letra1, letra2 = texto[i], texto[i + 1]
-            criptotexto += self.cifrar_digrama(letra1, letra2)
-
-        return criptotexto
+        return self.transformar(texto, 1)
 
     def descifrar_digrama(self, letra1, letra2):
         """
@@ -101,12 +144,4 @@ class PlayfairCipher:
         """
         Descifra el texto cifrado usando el cifrado Playfair.
         """
-        texto_cifrado = self.preprocesar_texto(texto_cifrado)
-        texto_claro = ''
-
-        # Dividir el texto cifrado en dígrafos
-        for i in range(0, len(texto_cifrado), 2):
-            letra1, letra2 = texto_cifrado[i], texto_cifrado[i + 1]
-            texto_claro += self.descifrar_digrama(letra1, letra2)
-
-        return texto_claro
+        return self.transformar(texto_cifrado, -1)
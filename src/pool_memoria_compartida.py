@@ -0,0 +1,161 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from evaluador_candidatos import EvaluadorCandidatos
+
+# Segmentos y vistas adjuntados por cada proceso trabajador (uno por proceso, no por tarea)
+_SEGMENTOS = []
+_VISTAS = {}
+
+
+def _adjuntar_segmentos(descripcion):
+    """
+    Inicializador de los trabajadores: se adjunta a los segmentos de memoria compartida
+    y construye vistas sin copia con el formato original de cada buffer.
+
+    Los trabajadores no cierran sus segmentos: terminan con os._exit, que no ejecuta
+    atexit, y el sistema operativo libera sus mapeos al salir. La única limpieza es
+    la de `cerrar` en el proceso que creó los segmentos, que los elimina.
+
+    :param descripcion: Diccionario nombre -> (nombre del segmento, formato, tamaño en bytes).
+    """
+    for nombre, (nombre_segmento, formato, tam_bytes) in descripcion.items():
+        segmento = shared_memory.SharedMemory(name=nombre_segmento)
+        _SEGMENTOS.append(segmento)
+        _VISTAS[nombre] = segmento.buf[:tam_bytes].cast(formato)
+
+
+def _ejecutar_tarea(funcion, descriptor):
+    """
+    Ejecuta una tarea en un trabajador pasándole las vistas compartidas.
+
+    :param funcion: Función funcion(vistas, descriptor) definida a nivel de módulo.
+    :param descriptor: Descripción pequeña de la tarea (por ejemplo un rango de claves).
+    :return: El resultado de la función.
+    """
+    return funcion(_VISTAS, descriptor)
+
+
+def puntuar_rango(vistas, descriptor):
+    """
+    Tarea de búsqueda exhaustiva: puntúa las claves con índice en [inicio, fin) sobre la
+    muestra del texto cifrado compartido y devuelve los k mejores del rango.
+
+    :param vistas: Vistas compartidas; se usan 'texto' (posiciones en el alfabeto) y 'tabla'
+                   (log-probabilidades por letra).
+    :param descriptor: Tupla (inicio, fin, clave_por_indice, descifrar, k, tam_muestra, tam_bloque,
+                       por_letra).
+    :return: Lista de tuplas (puntaje, indice) con a lo más k elementos.
+    """
+    inicio, fin, clave_por_indice, descifrar, k, tam_muestra, tam_bloque, por_letra = descriptor
+    evaluador = EvaluadorCandidatos(None, None, k=k, tam_muestra=tam_muestra,
+                                    tam_bloque=tam_bloque, tabla=vistas['tabla'], por_letra=por_letra)
+
+    claves = (clave_por_indice(indice) for indice in range(inicio, fin))
+    mejores = evaluador.puntuar_muestra(vistas['texto'], claves, descifrar)
+    # El orden local de cada candidato coincide con su desplazamiento dentro del rango
+    return [(puntaje, inicio + orden) for puntaje, orden, _ in mejores]
+
+
+class PoolMemoriaCompartida:
+    def __init__(self, buffers, procesos=None):
+        """
+        Copia cada buffer una sola vez a un segmento de `multiprocessing.shared_memory` y
+        crea un grupo de procesos que se adjuntan a ellos al iniciar. Las tareas solo
+        envían descriptores pequeños; los datos nunca se serializan por tarea.
+
+        :param buffers: Diccionario nombre -> objeto con protocolo de buffer de una dimensión
+                        (bytes, array.array, arreglo de numpy).
+        :param procesos: Número de procesos trabajadores (por defecto, el número de CPUs).
+        """
+        self.procesos = procesos or os.cpu_count() or 1
+        self.segmentos = []
+        descripcion = {}
+        try:
+            for nombre, buffer in buffers.items():
+                vista = memoryview(buffer)
+                datos = vista.cast('B') if vista.format != 'B' else vista
+                segmento = shared_memory.SharedMemory(create=True, size=max(datos.nbytes, 1))
+                self.segmentos.append(segmento)
+                segmento.buf[:datos.nbytes] = datos
+                descripcion[nombre] = (segmento.name, vista.format, datos.nbytes)
+
+            self.executor = ProcessPoolExecutor(max_workers=self.procesos,
+                                                initializer=_adjuntar_segmentos,
+                                                initargs=(descripcion,))
+        except BaseException:
+            self.executor = None
+            self.cerrar()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+        return False
+
+    def mapear(self, funcion, descriptores):
+        """
+        Ejecuta funcion(vistas, descriptor) en los trabajadores para cada descriptor.
+        Si una tarea falla, se cancela o un trabajador muere, se cancelan las tareas
+        pendientes y se propaga la excepción.
+
+        :param funcion: Función definida a nivel de módulo.
+        :param descriptores: Iterable de descriptores de tarea.
+        :return: Lista de resultados en el mismo orden que los descriptores.
+        """
+        futuros = [self.executor.submit(_ejecutar_tarea, funcion, descriptor) for descriptor in descriptores]
+        try:
+            return [futuro.result() for futuro in futuros]
+        except BaseException:
+            for futuro in futuros:
+                futuro.cancel()
+            raise
+
+    def buscar_claves(self, total_claves, clave_por_indice, descifrar, k=5,
+                      tam_muestra=300, tam_bloque=50, tam_tarea=None, por_letra=False):
+        """
+        Reparte el espacio de claves [0, total_claves) en rangos y puntúa cada rango en un
+        trabajador. Requiere los buffers 'texto' y 'tabla'.
+
+        :param total_claves: Número total de claves del espacio de búsqueda.
+        :param clave_por_indice: Función a nivel de módulo que convierte un índice en una clave.
+        :param descifrar: Función a nivel de módulo descifrar(clave, fragmento, desplazamiento).
+        :param k: Número de candidatos a conservar.
+        :param tam_muestra: Número de letras usadas para la puntuación.
+        :param tam_bloque: Número de letras descifradas antes de intentar descartar.
+        :param tam_tarea: Número de claves por tarea (por defecto, cuatro tareas por trabajador).
+        :param por_letra: Ver `EvaluadorCandidatos`.
+        :return: Lista de tuplas (puntaje, orden, clave) con los k mejores globales,
+                 listo para `EvaluadorCandidatos.confirmar`.
+        """
+        if tam_tarea is None:
+            tam_tarea = max(1, -(-total_claves // (4 * self.procesos)))
+
+        descriptores = [(inicio, min(inicio + tam_tarea, total_claves), clave_por_indice,
+                         descifrar, k, tam_muestra, tam_bloque, por_letra)
+                        for inicio in range(0, total_claves, tam_tarea)]
+        parciales = self.mapear(puntuar_rango, descriptores)
+
+        # Fusionar los k mejores de cada rango
+        mejores = heapq.nlargest(k, (item for parcial in parciales for item in parcial))
+        return [(puntaje, indice, clave_por_indice(indice)) for puntaje, indice in mejores]
+
+    def cerrar(self):
+        """
+        Detiene los trabajadores y libera los segmentos de memoria compartida.
+        Es seguro llamarlo varias veces.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+        while self.segmentos:
+            segmento = self.segmentos.pop()
+            segmento.close()
+            try:
+                segmento.unlink()
+            except FileNotFoundError:
+                pass
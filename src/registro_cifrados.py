@@ -0,0 +1,52 @@
+import importlib
+
+class RegistroCifrados:
+    # Nombre del cifrado -> (módulo, clase). Los módulos se importan hasta que se usan,
+    # así una ejecución con el cifrado afín o Playfair no paga la importación de numpy.
+    cifrados = {
+        'afin': ('affine_cipher', 'CifradoAfin'),
+        'cascada': ('cascada_cifrados', 'CascadaCifrados'),
+        'hill': ('hill_cipher', 'HillCipher'),
+        'monoalfabetico': ('mono_alf_cipher', 'CifradoMonoalfabeticoAleatorio'),
+        'playfair': ('playfair_cipher', 'PlayfairCipher'),
+        'vigenere': ('vigenere_cipher', 'CifradoVigenere'),
+    }
+
+    cargados = {}
+
+    @staticmethod
+    def registrar(nombre, modulo, clase):
+        """
+        Registra un cifrado sin importar su módulo.
+        
+        :param nombre: Nombre con el que se obtendrá el cifrado.
+        :param modulo: Nombre del módulo que contiene la implementación.
+        :param clase: Nombre de la clase dentro del módulo.
+        """
+        RegistroCifrados.cifrados[nombre] = (modulo, clase)
+        RegistroCifrados.cargados.pop(nombre, None)
+
+    @staticmethod
+    def obtener(nombre):
+        """
+        Obtiene la clase de un cifrado, importando su módulo la primera vez que se usa.
+        
+        :param nombre: Nombre del cifrado registrado.
+        :return: La clase que implementa el cifrado.
+        """
+        if nombre not in RegistroCifrados.cargados:
+            if nombre not in RegistroCifrados.cifrados:
+                raise ValueError(f"El cifrado '{nombre}' no está registrado. "
+                                 f"Disponibles: {', '.join(RegistroCifrados.disponibles())}")
+            modulo, clase = RegistroCifrados.cifrados[nombre]
+            RegistroCifrados.cargados[nombre] = getattr(importlib.import_module(modulo), clase)
+        return RegistroCifrados.cargados[nombre]
+
+    @staticmethod
+    def disponibles():
+        """
+        Lista los nombres de los cifrados registrados.
+        
+        :return: Lista ordenada de nombres.
+        """
+        return sorted(RegistroCifrados.cifrados)
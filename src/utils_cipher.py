@@ -1,6 +1,22 @@
 from collections import Counter
+import math
 import unicodedata
 
+# Frecuencias relativas (en porcentaje) de las letras en textos de referencia.
+FRECUENCIAS_ES = {
+    'A': 12.53, 'B': 1.42, 'C': 4.68, 'D': 5.86, 'E': 13.68, 'F': 0.69, 'G': 1.01,
+    'H': 0.70, 'I': 6.25, 'J': 0.44, 'K': 0.02, 'L': 4.97, 'M': 3.15, 'N': 6.71,
+    'Ñ': 0.31, 'O': 8.68, 'P': 2.51, 'Q': 0.88, 'R': 6.87, 'S': 7.98, 'T': 4.63,
+    'U': 3.93, 'V': 0.90, 'W': 0.01, 'X': 0.22, 'Y': 0.90, 'Z': 0.52
+}
+
+FRECUENCIAS_EN = {
+    'A': 8.167, 'B': 1.492, 'C': 2.782, 'D': 4.253, 'E': 12.702, 'F': 2.228, 'G': 2.015,
+    'H': 6.094, 'I': 6.966, 'J': 0.153, 'K': 0.772, 'L': 4.025, 'M': 2.406, 'N': 6.749,
+    'O': 7.507, 'P': 1.929, 'Q': 0.095, 'R': 5.987, 'S': 6.327, 'T': 9.056, 'U': 2.758,
+    'V': 0.978, 'W': 2.360, 'X': 0.150, 'Y': 1.974, 'Z': 0.074
+}
+
 class UtilsCipher:
     @staticmethod
     def gcd(a, b):
@@ -87,6 +103,48 @@ class UtilsCipher:
         
         return table
 
+    @staticmethod
+    def texto_a_numeros(texto, alfabeto):
+        """
+        Convierte un texto preprocesado a la lista de posiciones de sus letras en el alfabeto.
+        Lanza ValueError si el texto contiene letras que no están en el alfabeto.
+        
+        :param texto: El texto preprocesado (solo letras del alfabeto).
+        :param alfabeto: El alfabeto a usar.
+        :return: Lista de números correspondientes al texto.
+        """
+        posiciones = {letra: i for i, letra in enumerate(alfabeto)}
+        try:
+            return [posiciones[letra] for letra in texto]
+        except KeyError:
+            raise ValueError("El texto contiene letras que no están en el alfabeto.") from None
+
+    @staticmethod
+    def numeros_a_texto(numeros, alfabeto):
+        """
+        Convierte una secuencia de posiciones en el alfabeto de vuelta a texto.
+        
+        :param numeros: Secuencia de números a convertir.
+        :param alfabeto: El alfabeto a usar.
+        :return: El texto correspondiente.
+        """
+        return ''.join([alfabeto[num] for num in numeros])
+
+    @staticmethod
+    def log_frecuencias(alfabeto, bandera):
+        """
+        Calcula el logaritmo de la probabilidad de cada letra del alfabeto en el idioma indicado.
+        Se usa para puntuar qué tan parecido al idioma es un texto descifrado.
+        
+        :param alfabeto: El alfabeto a usar; la tabla se indexa por la posición de la letra.
+        :param bandera: 'es' para español, 'en' para inglés.
+        :return: Lista con log10 de la probabilidad de cada letra del alfabeto.
+        """
+        frecuencias = FRECUENCIAS_ES if bandera == 'es' else FRECUENCIAS_EN
+        total = sum(frecuencias.get(letra, 0) for letra in alfabeto)
+        # Las letras ausentes de la tabla reciben una probabilidad mínima para evitar log(0)
+        return [math.log10(max(frecuencias.get(letra, 0), 0.001) / total) for letra in alfabeto]
+
 
     @staticmethod
     def preprocesar_texto(texto, bandera):
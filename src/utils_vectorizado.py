@@ -0,0 +1,44 @@
+import numpy as np
+
+class UtilsVectorizado:
+    @staticmethod
+    def codificar(texto, alfabeto):
+        """
+        Convierte un texto preprocesado en un arreglo uint8 con la posición de cada letra
+        en el alfabeto, en una sola pasada (sin listas intermedias de Python).
+        
+        :param texto: El texto preprocesado (solo letras del alfabeto).
+        :param alfabeto: El alfabeto a usar (a lo más 256 letras).
+        :return: Arreglo de numpy uint8 con una posición por letra.
+        """
+        tabla = {ord(letra): i for i, letra in enumerate(alfabeto)}
+        try:
+            numeros = np.frombuffer(texto.translate(tabla).encode('latin-1'), dtype=np.uint8)
+        except UnicodeEncodeError:
+            numeros = None
+        if numeros is None or (numeros.size and numeros.max() >= len(alfabeto)):
+            raise ValueError("El texto contiene letras que no están en el alfabeto.")
+        return numeros
+
+    @staticmethod
+    def decodificar(numeros, alfabeto):
+        """
+        Convierte un arreglo de posiciones en el alfabeto de vuelta a texto.
+        
+        :param numeros: Arreglo de posiciones (cualquier tipo entero con valores < 256).
+        :param alfabeto: El alfabeto a usar.
+        :return: El texto correspondiente.
+        """
+        tabla = {i: ord(letra) for i, letra in enumerate(alfabeto)}
+        return np.asarray(numeros, dtype=np.uint8).tobytes().decode('latin-1').translate(tabla)
+
+    @staticmethod
+    def dividir_en_bloques(texto, tam_bloque=10):
+        """
+        Divide un texto en bloques separados por espacios, como la salida de los cifrados.
+        
+        :param texto: El texto a dividir.
+        :param tam_bloque: Número de letras por bloque.
+        :return: El texto en bloques.
+        """
+        return ' '.join([texto[i:i+tam_bloque] for i in range(0, len(texto), tam_bloque)])
@@ -0,0 +1,97 @@
+import os
+import sys
+import tempfile
+import unittest
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from affine_cipher import CifradoAfin
+from busqueda_reanudable import BusquedaReanudable
+from evaluador_candidatos import EvaluadorCandidatos
+from utils_cipher import UtilsCipher
+
+
+class Interrupcion(Exception):
+    pass
+
+
+class TestBusquedaReanudable(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        ruta_texto = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'docs',
+                                  'Texto1_cifrado_afin.txt')
+        with open(ruta_texto, 'r', encoding='utf-8') as archivo:
+            texto = CifradoAfin.preprocesar_texto(archivo.read(), 'es')
+        self.alfabeto = CifradoAfin.obtener_alfabeto('es')
+        N = len(self.alfabeto)
+        self.numeros = UtilsCipher.texto_a_numeros(texto, self.alfabeto)
+        self.total = CifradoAfin.total_claves(N)
+        self.clave_por_indice = partial(CifradoAfin.clave_por_indice, N=N)
+        self.descifrar = partial(CifradoAfin.descifrar_numeros, N=N)
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def ruta(self, nombre):
+        return os.path.join(self.directorio.name, nombre)
+
+    def busqueda(self, nombre, descifrar=None, **kwargs):
+        evaluador = EvaluadorCandidatos(self.alfabeto, 'es', k=4)
+        return BusquedaReanudable(self.ruta(nombre), self.numeros, self.total, self.clave_por_indice,
+                                  descifrar or self.descifrar, evaluador, intervalo=40, **kwargs)
+
+    def test_reanudar_da_el_mismo_resultado(self):
+        referencia = self.busqueda('referencia.json').ejecutar()
+
+        llamadas = [0]
+
+        def descifrar_con_falla(clave, fragmento, desplazamiento):
+            llamadas[0] += 1
+            if llamadas[0] == 700:
+                raise Interrupcion()
+            return self.descifrar(clave, fragmento, desplazamiento)
+
+        with self.assertRaises(Interrupcion):
+            self.busqueda('interrumpida.json', descifrar_con_falla).ejecutar()
+        self.assertGreater(BusquedaReanudable.leer(self.ruta('interrumpida.json'))['cursor'], 0)
+
+        self.assertEqual(self.busqueda('interrumpida.json').ejecutar(), referencia)
+
+    def test_dividir_y_fusionar_da_el_mismo_resultado(self):
+        referencia = self.busqueda('referencia.json').ejecutar()
+        self.busqueda('parte1.json', fin=100).ejecutar()
+        self.busqueda('parte2.json', inicio=100).ejecutar()
+
+        fusionados = BusquedaReanudable.fusionar([self.ruta('parte1.json'), self.ruta('parte2.json')],
+                                                 4, self.clave_por_indice)
+        self.assertEqual([clave for _, _, clave in fusionados],
+                         [clave for _, _, clave in sorted(referencia, reverse=True)])
+
+    def test_fuerza_bruta_por_rangos(self):
+        ruta_texto = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'docs',
+                                  'Texto1_cifrado_afin.txt')
+        with open(ruta_texto, 'r', encoding='utf-8') as archivo:
+            texto = archivo.read()
+        referencia = CifradoAfin.fuerza_bruta_ranking(texto, 'es', k=3)
+
+        rutas = [self.ruta('rango1.json'), self.ruta('rango2.json')]
+        CifradoAfin.fuerza_bruta_ranking(texto, 'es', k=3, ruta_punto_control=rutas[0], fin=200)
+        CifradoAfin.fuerza_bruta_ranking(texto, 'es', k=3, ruta_punto_control=rutas[1], inicio=200)
+        self.assertEqual(CifradoAfin.fusionar_rangos(rutas, texto, 'es', k=3), referencia)
+
+        with self.assertRaises(ValueError):
+            CifradoAfin.fusionar_rangos(rutas, texto, 'en', k=3)
+
+    def test_fusionar_rechaza_traslapes_y_huecos(self):
+        self.busqueda('a.json', fin=100).ejecutar()
+        self.busqueda('b.json', inicio=50).ejecutar()
+        self.busqueda('c.json', inicio=150).ejecutar()
+        with self.assertRaises(ValueError):
+            BusquedaReanudable.fusionar([self.ruta('a.json'), self.ruta('b.json')], 4, self.clave_por_indice)
+        with self.assertRaises(ValueError):
+            BusquedaReanudable.fusionar([self.ruta('a.json'), self.ruta('c.json')], 4, self.clave_por_indice)
+
+
+if __name__ == '__main__':
+    unittest.main()